@@ -7,12 +7,16 @@ for a specific date range and returns a dictionary with dates as keys and rates
 """
 
 import requests
-import json
+import orjson
+import numpy as np
 from typing import Optional, Dict
-from datetime import datetime
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 
+# Shared session so repeated calls reuse the keep-alive connection to the NBP API
+session = requests.Session()
+session.headers.update({"Accept": "application/json", "Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+
 
 def fetch_usd_exchange_rates() -> Optional[Dict[str, float]]:
     """
@@ -27,23 +31,15 @@ def fetch_usd_exchange_rates() -> Optional[Dict[str, float]]:
     
     try:
         # Make GET request to NBP API
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()  # Raise exception for bad status codes
-        
-        # Parse JSON response
-        data = response.json()
+        with session.get(url, timeout=10, stream=True) as response:
+            response.raise_for_status()  # Raise exception for bad status codes
+            
+            # Parse JSON response straight from the raw (decompressed) bytes
+            data = orjson.loads(response.raw.read(decode_content=True))
         
-        # Extract exchange rates and create dictionary
+        # Extract exchange rates (the API already returns them in ascending date order)
         if 'rates' in data and len(data['rates']) > 0:
-            exchange_rates = {}
-            for rate in data['rates']:
-                effective_date = rate['effectiveDate']
-                mid_rate = rate['mid']
-                exchange_rates[effective_date] = mid_rate
-            
-            # Sort dictionary by date (ascending order)
-            sorted_rates = dict(sorted(exchange_rates.items()))
-            return sorted_rates
+            return {rate['effectiveDate']: rate['mid'] for rate in data['rates']}
         else:
             print("Error: No exchange rate data found in response")
             return None
@@ -51,7 +47,7 @@ def fetch_usd_exchange_rates() -> Optional[Dict[str, float]]:
     except requests.exceptions.RequestException as e:
         print(f"Error making request to NBP API: {e}")
         return None
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print(f"Error parsing JSON response: {e}")
         return None
     except KeyError as e:
@@ -73,8 +69,8 @@ def plot_exchange_rates(exchange_rates: Dict[str, float]) -> None:
         print("No data to plot")
         return
     
-    # Convert string dates to datetime objects
-    dates = [datetime.strptime(date, '%Y-%m-%d') for date in exchange_rates.keys()]
+    # Convert ISO-8601 date strings with NumPy's C parser; matplotlib plots datetime64 natively
+    dates = np.array(list(exchange_rates.keys()), dtype='datetime64[D]')
     rates = list(exchange_rates.values())
     
     # Create the plot
@@ -5,62 +5,156 @@ Chart Utilities
 This module contains chart creation and visualization utilities for the NBP application.
 """
 
+import io
 import streamlit as st
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from typing import Dict
-from datetime import datetime
+from typing import TYPE_CHECKING
+from config import NBPConfig
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Month abbreviations indexed by month number (1-12) for chart titles
+MONTH_ABBR = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
 
 
 class ChartRenderer:
     """Class for rendering charts and visualizations."""
     
     @staticmethod
-    def create_exchange_rate_chart(data: Dict[str, float], data_type: str, currency: str = None) -> None:
+    def create_exchange_rate_chart(data: "pd.Series", data_type: str, currency: str = None) -> None:
         """
         Creates a line chart showing exchange rates or gold prices over time.
         
         Args:
-            data: Dictionary with dates as keys and rates/prices as values
+            data: Series of rates/prices indexed by date
             data_type: Type of data ('exchange_rate' or 'gold_price')
             currency: Currency code for the title (only for exchange rates)
         """
-        if not data:
+        if data is None or data.empty:
             st.warning("No data to plot")
             return
         
         # Render chart subheader
         st.subheader("📊 Chart")
         
-        # Convert string dates to datetime objects
-        dates = [datetime.strptime(date, '%Y-%m-%d') for date in data.keys()]
-        values = list(data.values())
+        if NBPConfig.CHART_BACKEND == "matplotlib":
+            # Reuse the rendered PNG when the same data is charted again
+            chart_png = ChartRenderer._render_chart_png(data, data_type, currency)
+            
+            # Display the plot in Streamlit
+            st.image(chart_png, width="stretch")
+        else:
+            # Ship the data points to the browser and let Vega-Lite draw them
+            st.altair_chart(ChartRenderer._build_altair_chart(data, data_type, currency), width="stretch")
+    
+    @staticmethod
+    def _get_chart_labels(data: "pd.Series", data_type: str, currency: str = None):
+        """
+        Returns the chart title and y-axis label for the given data.
+        
+        Args:
+            data: Series of rates/prices indexed by date, in ascending order
+            data_type: Type of data ('exchange_rate' or 'gold_price')
+            currency: Currency code for the title (only for exchange rates)
+        
+        Returns:
+            tuple: Chart title and y-axis label
+        """
+        # Format the period from the index fields instead of locale-dependent strftime
+        first_date, last_date = data.index[0], data.index[-1]
+        period = f'{MONTH_ABBR[first_date.month]} {first_date.year} - {MONTH_ABBR[last_date.month]} {last_date.year}'
+        if data_type == 'gold_price':
+            return f'Gold Price, PLN ({period})', 'Price (PLN)'
+        return f'{currency} Exchange Rate, PLN ({period})', 'Exchange Rate (PLN)'
+    
+    @staticmethod
+    def _get_date_locator(point_count: int):
+        """
+        Returns an x-axis locator that yields roughly ten date ticks.
+        
+        Args:
+            point_count: Number of data points on the chart
+        
+        Returns:
+            mdates.DateLocator: Month-based locator for long ranges, day-based otherwise
+        """
+        import matplotlib.dates as mdates
+        
+        # Ranges are capped at MAX_DATE_RANGE_DAYS, so monthly ticks are the coarsest needed
+        interval_days = max(1, point_count // 10)
+        if interval_days > 20:
+            return mdates.MonthLocator()
+        return mdates.DayLocator(interval=interval_days)
+    
+    @staticmethod
+    def _build_altair_chart(data: "pd.Series", data_type: str, currency: str = None):
+        """
+        Builds an interactive Altair line chart of exchange rates or gold prices.
         
-        # Create the plot with transparent background
-        fig, ax = plt.subplots(figsize=(12, 6))
+        Args:
+            data: Series of rates/prices indexed by date
+            data_type: Type of data ('exchange_rate' or 'gold_price')
+            currency: Currency code for the title (only for exchange rates)
         
-        ax.plot(dates, values, marker='o', linewidth=2, markersize=4, color='#1f77b4')
+        Returns:
+            alt.Chart: Line chart with point markers
+        """
+        # Heavy imports are deferred until a chart is actually drawn
+        import altair as alt
+        import pandas as pd
+        
+        title, y_label = ChartRenderer._get_chart_labels(data, data_type, currency)
+        df = pd.DataFrame({"date": data.index, "value": data.to_numpy()})
+        
+        return alt.Chart(df).mark_line(point=True, color='#1f77b4').encode(
+            x=alt.X("date:T", title="Date", axis=alt.Axis(format="%Y-%m-%d")),
+            y=alt.Y("value:Q", title=y_label, scale=alt.Scale(zero=False)),
+            tooltip=[alt.Tooltip("date:T", title="Date", format="%Y-%m-%d"),
+                     alt.Tooltip("value:Q", title=y_label, format=".4f")]
+        ).properties(title=title, height=450)
+    
+    @staticmethod
+    @st.cache_data(max_entries=NBPConfig.CHART_CACHE_MAX_ENTRIES, show_spinner=False)
+    def _render_chart_png(data: "pd.Series", data_type: str, currency: str = None) -> bytes:
+        """
+        Draws the exchange rate or gold price chart and returns it as PNG bytes.
+        
+        Args:
+            data: Series of rates/prices indexed by date
+            data_type: Type of data ('exchange_rate' or 'gold_price')
+            currency: Currency code for the title (only for exchange rates)
+        
+        Returns:
+            bytes: PNG image of the chart with a transparent background
+        """
+        # Heavy imports are deferred until a chart is actually drawn
+        import matplotlib.dates as mdates
+        from matplotlib.figure import Figure
+        
+        # Create the Figure directly so pyplot's global registry never holds on to it
+        fig = Figure(figsize=(12, 6))
+        ax = fig.subplots()
+        
+        ax.plot(data.index, data.to_numpy(), marker='o', linewidth=2, markersize=4, color='#1f77b4')
         
         # Customize the plot based on data type
-        if data_type == 'gold_price':
-            ax.set_title(f'Gold Price, PLN ({dates[0].strftime("%b %Y")} - {dates[-1].strftime("%b %Y")})', 
-                         fontsize=14, fontweight='bold')
-            ax.set_ylabel('Price (PLN)', fontsize=12)
-        else:  # exchange_rate
-            ax.set_title(f'{currency} Exchange Rate, PLN ({dates[0].strftime("%b %Y")} - {dates[-1].strftime("%b %Y")})', 
-                         fontsize=14, fontweight='bold')
-            ax.set_ylabel('Exchange Rate (PLN)', fontsize=12)
+        title, y_label = ChartRenderer._get_chart_labels(data, data_type, currency)
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.set_ylabel(y_label, fontsize=12)
         
         ax.set_xlabel('Date', fontsize=12)
         ax.grid(True, alpha=0.3)
         
         # Format x-axis to show dates nicely
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(dates)//10)))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
+        ax.xaxis.set_major_locator(ChartRenderer._get_date_locator(len(data)))
+        ax.tick_params(axis='x', labelrotation=45)
         
         # Add some styling
-        plt.tight_layout()
+        fig.tight_layout()
         
-        # Display the plot in Streamlit
-        st.pyplot(fig, transparent=True)
+        # Rasterize the figure to PNG bytes
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=200, bbox_inches='tight', transparent=True)
+        return buffer.getvalue()
@@ -18,21 +18,44 @@ class NBPConfig:
     
     # API Settings
     REQUEST_TIMEOUT = 10
+    POOL_CONNECTIONS = 8
+    POOL_MAXSIZE = 32  # Keep above MAX_FETCH_WORKERS so concurrent fetches never wait for a connection
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF_FACTOR = 0.3
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    MAX_FETCH_WORKERS = 4
+    REQUEST_HEADERS = {
+        "User-Agent": "nbp-streamlit/1.0",
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+    
+    # Cache Settings (historical NBP data does not change, so entries can live for hours)
+    CACHE_TTL_SECONDS = 3600
+    CACHE_MAX_ENTRIES = 256
+    CHART_CACHE_MAX_ENTRIES = 16
+    DISK_CACHE_DIR = ".nbp_cache"  # Next to nbp_api_client.py; used only when the optional diskcache package is installed
+    
+    # Chart Settings ('altair' draws in the browser, 'matplotlib' renders a static PNG for export)
+    CHART_BACKEND = "altair"
     
     # Date Range Limits
     MAX_DATE_RANGE_DAYS = 367
     MIN_DATE_YEAR_CURRENCIES = 2002  # Currency exchange rates start from Jan 2, 2002
     MIN_DATE_YEAR_GOLD = 2013  # Gold prices start from Jan 2, 2013
     
-    # Supported Currencies
-    SUPPORTED_CURRENCIES = ["USD", "EUR", "CHF", "GBP"]
+    # Supported Currencies (ordered tuple for display, frozenset for membership checks)
+    CURRENCY_CODES = ("USD", "EUR", "CHF", "GBP")
+    SUPPORTED_CURRENCIES = frozenset(CURRENCY_CODES)
     GOLD_ASSET = "Gold"
+    ASSET_OPTIONS = CURRENCY_CODES + (GOLD_ASSET,)
     
     # UI Messages
     PAGE_TITLE = "NBP Exchange Rates"
     FOOTER_MESSAGE = f"Data source: [NBP API]({API_BASE_URL})"
     SIDEBAR_INSTRUCTIONS = f"""
-    1. Select a currency ({', '.join(SUPPORTED_CURRENCIES)}) or {GOLD_ASSET}
+    1. Select a currency ({', '.join(CURRENCY_CODES)}) or {GOLD_ASSET}
     2. Choose your date range (max {MAX_DATE_RANGE_DAYS} days)
     3. Click "Fetch Data"
     4. View the data table and chart
@@ -44,6 +67,12 @@ class NBPConfig:
     - Weekends and holidays excluded
     """
     
+    # Header texts, built once instead of on every rerun
+    _TITLE_GOLD = "💰 NBP Gold Prices Dashboard"
+    _TITLE_CURRENCY = "💰 NBP Exchange Rates Dashboard"
+    _DESCRIPTION_GOLD = "Fetch and visualize gold prices from the Polish National Bank (NBP) API"
+    _DESCRIPTION_CURRENCY = "Fetch and visualize exchange rates from the Polish National Bank (NBP) API"
+    
     @classmethod
     def get_main_title(cls, currency):
         """Returns the appropriate main title based on currency selection.
@@ -54,7 +83,7 @@ class NBPConfig:
         Returns:
             str: Title for the main header
         """
-        return f"💰 NBP {'Gold Prices' if currency == cls.GOLD_ASSET else 'Exchange Rates'} Dashboard"
+        return cls._TITLE_GOLD if currency == cls.GOLD_ASSET else cls._TITLE_CURRENCY
     
     @classmethod
     def get_main_description(cls, currency):
@@ -66,5 +95,5 @@ class NBPConfig:
         Returns:
             str: Description message for the main header
         """
-        return f"Fetch and visualize {'gold prices' if currency == cls.GOLD_ASSET else 'exchange rates'} from the Polish National Bank (NBP) API"
+        return cls._DESCRIPTION_GOLD if currency == cls.GOLD_ASSET else cls._DESCRIPTION_CURRENCY
     
@@ -8,64 +8,64 @@ This module contains CSS styling utilities for the NBP Streamlit application.
 import streamlit as st
 
 
+# Style blocks are built once at import time; Streamlit drops any element that is not
+# re-emitted on a rerun, so the render method still emits one on every run
+_BASE_CSS = """
+/* Sidebar styling */
+[data-testid="stSidebar"] {
+    background: linear-gradient(to bottom, #2c3e50, #34495e);
+}
+
+/* Sidebar text - set all text to light color */
+[data-testid="stSidebar"] * {
+    color: #ecf0f1 !important;
+}
+
+/* Input fields - override with dark text for readability */
+[data-testid="stSidebar"] input,
+[data-testid="stSidebar"] .stSelectbox > div > div > div,
+[data-testid="stSidebar"] .stDateInput > div > div > div,
+[data-testid="stSidebar"] .stSelectbox [data-baseweb="select"] *,
+[data-testid="stSidebar"] .stDateInput [data-baseweb="select"] * {
+    color: #2c3e50 !important;
+}
+
+/* Main content area styling */
+.main .block-container {
+    background: rgba(255, 255, 255, 0.95);
+    border-radius: 15px;
+    margin: 1rem;
+    box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
+}
+"""
+
+_STYLES_TEMPLATE = """
+<style>
+/* Main app background */
+.stApp {{
+    background: {gradient} !important;
+}}
+{base_css}</style>
+"""
+
+# Global styles and the currency-dependent background are sent as one block
+_DEFAULT_STYLES_HTML = _STYLES_TEMPLATE.format(gradient="linear-gradient(to bottom, #ffffff, #c2d6f0)", base_css=_BASE_CSS)
+_GOLD_STYLES_HTML = _STYLES_TEMPLATE.format(gradient="linear-gradient(to bottom, #ffffff, #faedaa)", base_css=_BASE_CSS)
+
+
 class CSSRenderer:
     """Class for rendering CSS styles and themes."""
     
     @staticmethod
-    def apply_custom_styles():
-        """Applies custom CSS styles to the Streamlit application."""
-        st.markdown("""
-        <style>
-        /* Main app background */
-        .stApp {
-            background: linear-gradient(to bottom, #ffffff, #c2d6f0);
-        }
-        
-        /* Sidebar styling */
-        [data-testid="stSidebar"] {
-            background: linear-gradient(to bottom, #2c3e50, #34495e);
-        }
-        
-        /* Sidebar text - set all text to light color */
-        [data-testid="stSidebar"] * {
-            color: #ecf0f1 !important;
-        }
-        
-        /* Input fields - override with dark text for readability */
-        [data-testid="stSidebar"] input,
-        [data-testid="stSidebar"] .stSelectbox > div > div > div,
-        [data-testid="stSidebar"] .stDateInput > div > div > div,
-        [data-testid="stSidebar"] .stSelectbox [data-baseweb="select"] *,
-        [data-testid="stSidebar"] .stDateInput [data-baseweb="select"] * {
-            color: #2c3e50 !important;
-        }
-        
-        /* Main content area styling */
-        .main .block-container {
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 15px;
-            margin: 1rem;
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-        }
-        </style>
-        """, unsafe_allow_html=True)
-    
-    @staticmethod
-    def apply_background(currency):
-        """Applies dynamic background based on selected currency.
+    def apply_styles(currency):
+        """Applies custom CSS styles and the currency-dependent background in one block.
         
         Args:
             currency: The selected currency or asset (changes background for Gold)
         """
         from config import NBPConfig
         
-        # Choose background gradient based on currency selection
-        background_gradient = "linear-gradient(to bottom, #ffffff, #faedaa)" if currency == NBPConfig.GOLD_ASSET else "linear-gradient(to bottom, #ffffff, #c2d6f0)"
+        # Choose the prebuilt style block based on currency selection
+        styles_html = _GOLD_STYLES_HTML if currency == NBPConfig.GOLD_ASSET else _DEFAULT_STYLES_HTML
         
-        st.markdown(f"""
-        <style>
-        .stApp {{
-            background: {background_gradient} !important;
-        }}
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(styles_html, unsafe_allow_html=True)
@@ -6,51 +6,176 @@ This module contains functions for fetching data from the Polish National Bank (
 It acts as a client to invoke NBP API endpoints for exchange rates and gold prices.
 """
 
+import os
+import threading
 import requests
-import json
-from typing import Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import TYPE_CHECKING, Optional, Dict, Iterable, List, Tuple
 from config import NBPConfig
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-def fetch_gold_prices(start_date: str, end_date: str) -> Optional[Dict[str, float]]:
+# Prefer the fastest available JSON parser; all of them accept raw bytes
+# and raise a ValueError subclass on malformed input
+try:
+    import orjson as json_parser
+except ImportError:
+    try:
+        import ujson as json_parser
+    except ImportError:
+        import json as json_parser
+
+# Optional persistent cache so closed historical ranges survive process restarts
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+
+# Shared session so repeated calls reuse the keep-alive connection to the NBP API
+# and transient server errors are retried with backoff
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=NBPConfig.POOL_CONNECTIONS,
+    pool_maxsize=NBPConfig.POOL_MAXSIZE,
+    max_retries=Retry(total=NBPConfig.RETRY_TOTAL,
+                      backoff_factor=NBPConfig.RETRY_BACKOFF_FACTOR,
+                      status_forcelist=NBPConfig.RETRY_STATUS_CODES,
+                      respect_retry_after_header=True)
+))
+_SESSION.headers.update(NBPConfig.REQUEST_HEADERS)
+
+# Disk cache is opened on first use next to this module; a failure to open it disables it
+_DISK_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), NBPConfig.DISK_CACHE_DIR)
+_DISK_CACHE = None
+_DISK_CACHE_DISABLED = Cache is None
+_DISK_CACHE_LOCK = threading.Lock()
+
+
+def _get_disk_cache() -> Optional["Cache"]:
     """
-    Fetches gold prices from NBP API for specified date range.
+    Returns the shared disk cache, opening it on first use.
+    
+    Returns:
+        Cache: The disk cache, or None if diskcache is not installed or the cache cannot be opened
+    """
+    global _DISK_CACHE, _DISK_CACHE_DISABLED
+    
+    if _DISK_CACHE_DISABLED:
+        return None
+    with _DISK_CACHE_LOCK:
+        if _DISK_CACHE is None and not _DISK_CACHE_DISABLED:
+            try:
+                _DISK_CACHE = Cache(_DISK_CACHE_PATH)
+            except Exception as e:
+                _DISK_CACHE_DISABLED = True
+    return _DISK_CACHE
+
+
+def _build_series(dates: List[str], values: List[float]) -> "pd.Series":
+    """
+    Builds a float64 Series indexed by date from parallel lists of dates and values.
     
     Args:
-        start_date: Start date in YYYY-MM-DD format
-        end_date: End date in YYYY-MM-DD format
+        dates: Dates in YYYY-MM-DD format, normally in ascending order
+        values: Rates or prices matching the dates
     
     Returns:
-        Dict[str, float]: Dictionary with dates as keys and gold prices as values, 
-                         sorted by date in ascending order, or None if request fails
+        pd.Series: Values indexed by a DatetimeIndex, sorted by date in ascending order
     """
-    url = f"{NBPConfig.GOLD_PRICES_BASE_URL}/{start_date}/{end_date}/"
+    # Deferred so importing the client does not pay for importing pandas
+    import pandas as pd
     
+    series = pd.Series(values, index=pd.to_datetime(dates, format='%Y-%m-%d'), dtype='float64')
+    
+    # NBP returns data chronologically, so only sort if a cheap monotonicity check fails
+    if not series.index.is_monotonic_increasing:
+        series = series.sort_index()
+    return series
+
+
+def _fetch_series(url: str, end_date: str, records_key: Optional[str], date_field: str, value_field: str) -> Optional["pd.Series"]:
+    """
+    Fetches a dated Series from an NBP API endpoint, using the disk cache when available.
+    
+    Ranges that ended before yesterday never change, so they are cached without expiry;
+    more recent ranges expire after NBPConfig.CACHE_TTL_SECONDS. Only plain lists of
+    dates and values are stored, and any cache error falls back to a direct request.
+    
+    Args:
+        url: Full NBP API URL to request
+        end_date: End date of the requested range in YYYY-MM-DD format
+        records_key: Key of the record list in the response, or None if the response is the list
+        date_field: Record field holding the date in YYYY-MM-DD format
+        value_field: Record field holding the rate/price
+    
+    Returns:
+        pd.Series: Values indexed by date (DatetimeIndex), sorted by date
+                   in ascending order, an empty Series if the range has no data,
+                   or None if request fails
+    """
+    cache = _get_disk_cache()
+    cache_key = f"records:{url}"
+    
+    records = None
+    if cache is not None:
+        try:
+            records = cache.get(cache_key)
+        except Exception as e:
+            records = None
+    
+    if records is None:
+        records = _request_records(url, records_key, date_field, value_field)
+        if records is None:
+            return None
+        if cache is not None:
+            # Leave a day of margin so a range ending on a local-time "yesterday" stays refreshable
+            closed_before = (date.today() - timedelta(days=1)).isoformat()
+            expire = None if end_date < closed_before else NBPConfig.CACHE_TTL_SECONDS
+            try:
+                cache.set(cache_key, records, expire=expire)
+            except Exception as e:
+                pass
+    
+    dates, values = records
+    return _build_series(dates, values)
+
+
+def _request_records(url: str, records_key: Optional[str], date_field: str, value_field: str) -> Optional[Tuple[List[str], List[float]]]:
+    """
+    Fetches a list of dated records from an NBP API endpoint as parallel lists of dates and values.
+    
+    Args:
+        url: Full NBP API URL to request
+        records_key: Key of the record list in the response, or None if the response is the list
+        date_field: Record field holding the date in YYYY-MM-DD format
+        value_field: Record field holding the rate/price
+    
+    Returns:
+        tuple: Lists of dates and values in response order, empty lists if the
+               range has no data, or None if request fails
+    """
     try:
-        # Make GET request to NBP API
-        response = requests.get(url, timeout=NBPConfig.REQUEST_TIMEOUT)
-        response.raise_for_status()
-        
-        # Parse JSON response
-        data = response.json()
+        # Make streaming GET request to NBP API and parse the body straight from the raw bytes
+        with _SESSION.get(url, timeout=NBPConfig.REQUEST_TIMEOUT, stream=True) as response:
+            # NBP answers 404 when nothing was published in the range (e.g. weekends and holidays)
+            if response.status_code == 404:
+                return [], []
+            if response.status_code != 200:
+                return None
+            data = json_parser.loads(response.raw.read(decode_content=True))
         
-        # Extract gold prices and create dictionary
-        if len(data) > 0:
-            gold_prices = {}
-            for item in data:
-                date = item['data']
-                price = item['cena']
-                gold_prices[date] = price
-            
-            # Sort dictionary by date (ascending order)
-            sorted_prices = dict(sorted(gold_prices.items()))
-            return sorted_prices
-        else:
-            return None
+        # Extract the dated records
+        records = data if records_key is None else data.get(records_key, [])
+        return ([record[date_field] for record in records],
+                [record[value_field] for record in records])
             
     except requests.exceptions.RequestException as e:
         return None
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         return None
     except KeyError as e:
         return None
@@ -58,7 +183,24 @@ def fetch_gold_prices(start_date: str, end_date: str) -> Optional[Dict[str, floa
         return None
 
 
-def fetch_exchange_rates(currency: str, start_date: str, end_date: str) -> Optional[Dict[str, float]]:
+def fetch_gold_prices(start_date: str, end_date: str) -> Optional["pd.Series"]:
+    """
+    Fetches gold prices from NBP API for specified date range.
+    
+    Args:
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+    
+    Returns:
+        pd.Series: Gold prices indexed by date (DatetimeIndex), sorted by date
+                   in ascending order, an empty Series if the range has no data,
+                   or None if request fails
+    """
+    url = f"{NBPConfig.GOLD_PRICES_BASE_URL}/{start_date}/{end_date}/"
+    return _fetch_series(url, end_date, None, 'data', 'cena')
+
+
+def fetch_exchange_rates(currency: str, start_date: str, end_date: str) -> Optional["pd.Series"]:
     """
     Fetches exchange rates from NBP API for specified currency and date range.
     
@@ -68,38 +210,30 @@ def fetch_exchange_rates(currency: str, start_date: str, end_date: str) -> Optio
         end_date: End date in YYYY-MM-DD format
     
     Returns:
-        Dict[str, float]: Dictionary with dates as keys and exchange rates as values, 
-                         sorted by date in ascending order, or None if request fails
+        pd.Series: Exchange rates indexed by date (DatetimeIndex), sorted by date
+                   in ascending order, an empty Series if the range has no data,
+                   or None if request fails
     """
     url = f"{NBPConfig.EXCHANGE_RATES_BASE_URL}/{currency}/{start_date}/{end_date}/"
+    return _fetch_series(url, end_date, 'rates', 'effectiveDate', 'mid')
+
+
+def fetch_exchange_rates_multi(currencies: Iterable[str], start_date: str, end_date: str) -> Dict[str, Optional["pd.Series"]]:
+    """
+    Fetches exchange rates for several currencies concurrently over the shared session.
     
-    try:
-        # Make GET request to NBP API
-        response = requests.get(url, timeout=NBPConfig.REQUEST_TIMEOUT)
-        response.raise_for_status()
-        
-        # Parse JSON response
-        data = response.json()
-        
-        # Extract exchange rates and create dictionary
-        if 'rates' in data and len(data['rates']) > 0:
-            exchange_rates = {}
-            for rate in data['rates']:
-                effective_date = rate['effectiveDate']
-                mid_rate = rate['mid']
-                exchange_rates[effective_date] = mid_rate
-            
-            # Sort dictionary by date (ascending order)
-            sorted_rates = dict(sorted(exchange_rates.items()))
-            return sorted_rates
-        else:
-            return None
-            
-    except requests.exceptions.RequestException as e:
-        return None
-    except json.JSONDecodeError as e:
-        return None
-    except KeyError as e:
-        return None
-    except Exception as e:
-        return None
+    Args:
+        currencies: Currency codes (USD, EUR, etc.)
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+    
+    Returns:
+        Dict[str, Optional[pd.Series]]: Dictionary with currency codes as keys and the
+                                        result of fetch_exchange_rates for each as values
+    """
+    currencies = list(currencies)
+    
+    # Requests release the GIL while waiting on the socket, so the fetches overlap
+    with ThreadPoolExecutor(max_workers=NBPConfig.MAX_FETCH_WORKERS) as executor:
+        results = executor.map(lambda currency: fetch_exchange_rates(currency, start_date, end_date), currencies)
+        return dict(zip(currencies, results))
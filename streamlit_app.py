@@ -17,6 +17,60 @@ from css_utils import CSSRenderer
 from ui_components import UIRenderer
 import time
 
+
+class FetchError(Exception):
+    """Raised when an NBP API request fails, so the failure is not cached."""
+
+
+@st.cache_data(ttl=NBPConfig.CACHE_TTL_SECONDS, max_entries=NBPConfig.CACHE_MAX_ENTRIES, show_spinner=False)
+def get_gold_prices(start_date, end_date):
+    """Cached wrapper around fetch_gold_prices keyed by the date range."""
+    data = fetch_gold_prices(start_date, end_date)
+    if data is None:
+        raise FetchError(f"Failed to fetch gold prices for {start_date} - {end_date}")
+    return data
+
+
+@st.cache_data(ttl=NBPConfig.CACHE_TTL_SECONDS, max_entries=NBPConfig.CACHE_MAX_ENTRIES, show_spinner=False)
+def get_exchange_rates(currency, start_date, end_date):
+    """Cached wrapper around fetch_exchange_rates keyed by currency and date range."""
+    data = fetch_exchange_rates(currency, start_date, end_date)
+    if data is None:
+        raise FetchError(f"Failed to fetch {currency} exchange rates for {start_date} - {end_date}")
+    return data
+
+
+def fetch_data(currency, start_date, end_date):
+    """Fetches gold prices or exchange rates for the selected asset through the cache.
+    
+    Returns:
+        pd.Series: Fetched rates/prices indexed by date, or None if the fetch failed
+    """
+    try:
+        if currency == NBPConfig.GOLD_ASSET:
+            return get_gold_prices(start_date, end_date)
+        return get_exchange_rates(currency, start_date, end_date)
+    except FetchError:
+        return None
+
+
+@st.fragment
+def render_results(data, data_type, data_label, value_label, currency):
+    """Renders the data table, statistics and chart for fetched data.
+    
+    Runs as a fragment so widgets added to the results area rerun only this
+    section instead of refetching and redrawing the whole page.
+    """
+    # Display data in a table
+    UIRenderer.render_data_table(data, data_label, value_label)
+
+    # Display statistics
+    UIRenderer.render_statistics(data)
+    
+    # Create and display the chart
+    ChartRenderer.create_exchange_rate_chart(data, data_type, currency)
+
+
 def main():
     # Setup page configuration and styling
     # Initialize session state for auto-fetch behavior
@@ -26,7 +80,6 @@ def main():
         st.session_state.prev_dates = None
 
     UIRenderer.setup_page()
-    CSSRenderer.apply_custom_styles()
     
     # Render sidebar controls
     UIRenderer.render_sidebar_header()
@@ -35,10 +88,11 @@ def main():
     # Render main page header with dynamic description
     UIRenderer.render_header(currency)
     
-    # Apply dynamic background based on currency selection
-    CSSRenderer.apply_background(currency)
+    # Apply custom styles with the background for the selected currency
+    CSSRenderer.apply_styles(currency)
     
-    start_date_input, end_date_input = UIRenderer.render_date_range_section(currency)
+    # Render the date range form, submitted by the fetch button
+    start_date_input, end_date_input, fetch_button_clicked = UIRenderer.render_date_range_section(currency)
     
     # Convert dates to string format
     start_date_str = start_date_input.strftime('%Y-%m-%d')
@@ -55,16 +109,19 @@ def main():
     if st.session_state.prev_dates is not None and st.session_state.prev_dates != current_dates:
         st.session_state.fetch = False
     
-    # Render fetch button
-    fetch_button_clicked = UIRenderer.render_fetch_button()
-    
     # Set flag on button click
     if fetch_button_clicked:
         st.session_state.fetch = True
         st.session_state.prev_dates = current_dates
     
+    # Bail out before any fetch or chart work when the date range is invalid
+    if not is_valid_range:
+        UIRenderer.render_sidebar_info()
+        UIRenderer.render_footer()
+        return
+    
     # Fetch data if: button was clicked OR flag is True (auto-fetch after first time)
-    if (fetch_button_clicked or st.session_state.fetch) and is_valid_range:
+    if fetch_button_clicked or st.session_state.fetch:
         # Determine spinner message based on currency
         spinner_message = f"Fetching and visualizing {'gold prices' if currency == NBPConfig.GOLD_ASSET else f'{currency} exchange rates'}..."
         
@@ -72,39 +129,33 @@ def main():
         data = None
         
         with st.spinner(spinner_message):
-            # Fetch data
             if currency == NBPConfig.GOLD_ASSET:
-                data = fetch_gold_prices(start_date_str, end_date_str)
                 data_type = "gold_price"
                 data_label = "Gold Prices"
                 value_label = "Price (PLN)"
             else:
-                data = fetch_exchange_rates(currency, start_date_str, end_date_str)
                 data_type = "exchange_rate"
                 data_label = f"{currency} Exchange Rates"
                 value_label = "Rate (PLN)"
             
-            if data:
+            # Fetch data (repeated inputs are served by the st.cache_data wrappers)
+            data = fetch_data(currency, start_date_str, end_date_str)
+            
+            if data is not None and not data.empty:
                 # Set flag and store current dates for auto-fetch on currency change
                 st.session_state.fetch = True
                 st.session_state.prev_dates = (start_date_str, end_date_str)
                 
-                # Display data in a table
-                UIRenderer.render_data_table(data, data_label, value_label)
-
-                # Display statistics
-                UIRenderer.render_statistics(data)
-                
-                # Create and display the chart
-                ChartRenderer.create_exchange_rate_chart(data, data_type, currency)
-                
-                # Add small delay to ensure chart is fully created
+                # Display table, statistics and chart
+                render_results(data, data_type, data_label, value_label, currency)
         
-        # Show success or error message after spinner completes
-        if data:
-            st.success(f"Successfully fetched {len(data)} {data_label.lower()} records!")
-        else:
+        # Show success, no-data or error message after spinner completes
+        if data is None:
             UIRenderer.render_error_message(currency)
+        elif data.empty:
+            UIRenderer.render_no_data_message()
+        else:
+            st.success(f"Successfully fetched {len(data)} {data_label.lower()} records!")
     
     # Render sidebar information and footer
     UIRenderer.render_sidebar_info()
@@ -6,7 +6,6 @@ This module contains UI component classes for the NBP Streamlit application.
 """
 
 import streamlit as st
-import pandas as pd
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from config import NBPConfig
@@ -44,24 +43,34 @@ class UIRenderer:
         """Renders the currency selection dropdown and returns the selected currency."""
         return st.sidebar.selectbox(
             "Select Currency/Asset",
-            NBPConfig.SUPPORTED_CURRENCIES + [NBPConfig.GOLD_ASSET],
+            NBPConfig.ASSET_OPTIONS,
             help="Choose the currency to fetch exchange rates for or Gold for gold prices"
         )
     
     @staticmethod
     def render_date_range_section(currency):
-        """Renders the date range selection section and returns the selected dates.
+        """Renders the date range form with the fetch button and returns the submitted values.
+        
+        The date inputs live in a form, so editing them does not rerun the app until
+        the fetch button submits the form. Both inputs share the same bounds because the
+        start date is only known after submit; the order is checked by render_date_validation.
         
         Args:
             currency: The selected currency or asset (e.g., 'USD', 'EUR', 'Gold')
+            
+        Returns:
+            tuple: Start date, end date and whether the fetch button was clicked
         """
         st.sidebar.subheader("Date Range")
         
+        # Read the clock once per rerun
+        today = datetime.now().date()
+        
         # Initialize default dates in session state if not present
         if 'start_date' not in st.session_state:
-            st.session_state.start_date = (datetime.now() - relativedelta(years=1)).date()
+            st.session_state.start_date = today - relativedelta(years=1)
         if 'end_date' not in st.session_state:
-            st.session_state.end_date = datetime.now().date()
+            st.session_state.end_date = today
         
         # Set minimum date based on asset type (Gold: 2013, Currencies: 2002)
         year = NBPConfig.MIN_DATE_YEAR_GOLD if currency == NBPConfig.GOLD_ASSET else NBPConfig.MIN_DATE_YEAR_CURRENCIES
@@ -72,52 +81,47 @@ class UIRenderer:
             st.session_state.start_date = min_date
         if st.session_state.end_date < min_date:
             # Set end_date to min_date + 1 year to avoid 0-day range
-            end_datetime = datetime.combine(min_date, datetime.min.time()) + relativedelta(years=1)
-            st.session_state.end_date = end_datetime.date()
+            st.session_state.end_date = min_date + relativedelta(years=1)
         
-        col1, col2 = st.sidebar.columns(2)
-        with col1:
-            start_date_input = st.date_input(
-                "Start Date",
-                value=st.session_state.start_date,
-                min_value=min_date,
-                max_value=datetime.now(),
-                key="start_date_widget"
-            )
-            # Update session state with current values
-            st.session_state.start_date = start_date_input
-            if st.session_state.end_date < st.session_state.start_date:
-                st.session_state.end_date = st.session_state.start_date
-        with col2:
-            end_date_input = st.date_input(
-                "End Date",
-                value=st.session_state.end_date,
-                min_value=st.session_state.start_date,
-                max_value=datetime.now(),
-                key="end_date_widget"
-            )
+        with st.sidebar.form("date_range_form"):
+            col1, col2 = st.columns(2)
+            with col1:
+                start_date_input = st.date_input(
+                    "Start Date",
+                    value=st.session_state.start_date,
+                    min_value=min_date,
+                    max_value=today,
+                    key="start_date_widget"
+                )
+            with col2:
+                end_date_input = st.date_input(
+                    "End Date",
+                    value=st.session_state.end_date,
+                    min_value=min_date,
+                    max_value=today,
+                    key="end_date_widget"
+                )
+            submitted = st.form_submit_button("📊 Fetch Data", type="primary")
         # Update session state with current values
+        st.session_state.start_date = start_date_input
         st.session_state.end_date = end_date_input
         
-        return start_date_input, end_date_input
+        return start_date_input, end_date_input, submitted
     
     @staticmethod
     def render_date_validation(date_range_days):
         """Renders date range validation messages."""
-        is_valid_range = date_range_days <= NBPConfig.MAX_DATE_RANGE_DAYS
+        is_valid_range = 0 <= date_range_days <= NBPConfig.MAX_DATE_RANGE_DAYS
         
-        if not is_valid_range:
+        if date_range_days < 0:
+            st.sidebar.error("❌ End date must not be before the start date.")
+        elif not is_valid_range:
             st.sidebar.error(f"❌ Date range too large! Maximum {NBPConfig.MAX_DATE_RANGE_DAYS} days allowed. Current range: {date_range_days} days")
         else:
             st.sidebar.success(f"✅ Date range: {date_range_days} days")
         
         return is_valid_range
     
-    @staticmethod
-    def render_fetch_button():
-        """Renders the fetch data button and returns the button state."""
-        return st.sidebar.button("📊 Fetch Data", type="primary")
-    
     @staticmethod
     def render_sidebar_info():
         """Renders the sidebar instructions and API limits."""
@@ -136,39 +140,58 @@ class UIRenderer:
     
     @staticmethod
     def render_statistics(data):
-        """Renders statistics metrics for the data."""
+        """Renders statistics metrics for the data.
+        
+        Args:
+            data: Series of rates/prices indexed by date
+        """
+        # Reduce the underlying float64 array directly, skipping pandas' NaN-aware wrappers
+        values = data.to_numpy()
+        
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("Records", len(data))
+            st.metric("Records", len(values))
         with col2:
-            st.metric("Min Value", f"{round(min(data.values()), 4)} PLN")
+            st.metric("Min Value", f"{round(float(values.min()), 4)} PLN")
         with col3:
-            st.metric("Max Value", f"{round(max(data.values()), 4)} PLN")
+            st.metric("Max Value", f"{round(float(values.max()), 4)} PLN")
         with col4:
-            avg_value = sum(data.values()) / len(data)
-            st.metric("Avg Value", f"{avg_value:.4f} PLN")
+            st.metric("Avg Value", f"{values.mean():.4f} PLN")
     
     @staticmethod
     def render_data_table(data, data_label, value_label):
         """Renders the data table with fetched rates/prices.
         
         Args:
-            data: Dictionary with date as key and rate/price as value
+            data: Series of rates/prices indexed by date
             data_label: Label for the data type (e.g., "USD Exchange Rates", "Gold Prices")
             value_label: Label for the value column (e.g., "Rate (PLN)", "Price (PLN)")
         """
-        st.subheader(f"📈 {data_label} Data")
+        # Deferred so the first page load does not pay for importing pandas
+        import pandas as pd
         
-        # Create a DataFrame for better display
-        df = pd.DataFrame([
-            {"Date": date, value_label: f"{rate:.4f}"}
-            for date, rate in data.items()
-        ])
+        st.subheader(f"📈 {data_label} Data")
         
-        # Reset index to start from 1 instead of 0
-        df.index = df.index + 1
+        # Create a DataFrame column-wise, numbering rows from 1 instead of 0
+        df = pd.DataFrame(
+            {"Date": data.index, value_label: data.to_numpy()},
+            index=range(1, len(data) + 1)
+        )
         
-        st.dataframe(df, use_container_width=True)
+        # Let the browser format dates and numbers instead of building strings in Python
+        st.dataframe(
+            df,
+            width="stretch",
+            column_config={
+                "Date": st.column_config.DateColumn(format="YYYY-MM-DD"),
+                value_label: st.column_config.NumberColumn(format="%.4f")
+            }
+        )
+    
+    @staticmethod
+    def render_no_data_message():
+        """Renders the message shown when NBP published no data in the selected range."""
+        st.info("No NBP data in this range (weekends and holidays only). Please choose a wider date range.")
     
     @staticmethod
     def render_error_message(currency):